@@ -0,0 +1,16 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('catalogue', '0019_auto_20210125_1039'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='productimage',
+            name='sha256',
+            field=models.CharField(blank=True, db_index=True, default='', max_length=64, verbose_name='SHA-256'),
+        ),
+    ]
@@ -1 +1,12 @@
+from django.db import models
+from oscar.apps.catalogue.abstract_models import AbstractProductImage
+
+
+class ProductImage(AbstractProductImage):
+    # SHA-256 hex digest of the image content. Lets the catalogue importer
+    # detect identical images without re-reading each blob from storage.
+    sha256 = models.CharField(
+        'SHA-256', max_length=64, db_index=True, blank=True, default='')
+
+
 from oscar.apps.catalogue.models import *  # noqa isort:skip
@@ -7,12 +7,37 @@ Additionally, contains a small CLI tool to do this from the command line.
 """
 
 import argparse
+import collections
 import csv
+import io
 import sys
 from typing import Optional
 
 import yaml
 
+try:
+    # The libyaml C emitter is an order of magnitude faster than the
+    # pure-python one.
+    from yaml import CSafeDumper as SafeDumper
+except ImportError:
+    from yaml import SafeDumper
+
+try:
+    import pandas
+except ImportError:
+    pandas = None
+
+try:
+    import pyarrow
+    import pyarrow.csv
+except ImportError:
+    pyarrow = None
+
+CSV_HEADERS = ("product_class", "category", "upc", "title", "description",
+               "partner_name", "partner_sku", "price", "num_in_stock")
+
+_Row = collections.namedtuple('Row', CSV_HEADERS)
+
 
 def parse_product(row: str) -> dict:
     """Parse the row from the fixture csv and convert to a python dictionary.
@@ -26,34 +51,112 @@ def parse_product(row: str) -> dict:
     Returns:
         A python dict that represents the product.
     """
-    csv_headers = ("product_class", "category", "upc", "title", "description",
-                   "partner_name", "partner_sku", "price", "num_in_stock")
-    _ = dict(zip(csv_headers, row))
+    _ = _Row._make(row)
 
     return {
         "product": {
-            "upc": _["upc"],
-            "title": _["title"],
-            "description": _["description"],
+            "upc": _.upc,
+            "title": _.title,
+            "description": _.description,
             "product_class": {
-                "name": _["product_class"],
+                "name": _.product_class,
             },
             "categories": [
-                {"name": _["category"]},
+                {"name": _.category},
             ],
         },
         "partner": {
-            "name": _["partner_name"],
+            "name": _.partner_name,
         },
-        "partner_sku": _["partner_sku"],
-        "price": _["price"],
-        "num_in_stock": int(_["num_in_stock"]),
+        "partner_sku": _.partner_sku,
+        "price": _.price,
+        "num_in_stock": int(_.num_in_stock),
     }
 
 
+def _parse_stock_pandas(path: str) -> list:
+    """Parse the fixture csv with pandas' C tokenizer.
+
+    All columns are read as strings so the output matches the pure-python
+    parser exactly (parse_product does the int conversion itself).
+
+    Args:
+        path (str): The path to the csv file.
+
+    Returns:
+        The list of parsed stock record dicts.
+    """
+    frame = pandas.read_csv(path, names=CSV_HEADERS, escapechar='\\',
+                            dtype=str, keep_default_na=False)
+    return [parse_product(row) for row in frame.itertuples(index=False)]
+
+
+def parse_csv_rows(buf):
+    """Lazily parse stock records from an in-memory or file-like buffer.
+
+    Yields one parsed record at a time, so callers can stream rows
+    straight into their own container without a per-file intermediate
+    list ever being materialized.
+
+    Args:
+        buf: A text-mode file-like object yielding the csv lines.
+
+    Yields:
+        The parsed stock record dicts.
+    """
+    for row in csv.reader(buf, escapechar='\\'):
+        yield parse_product(row)
+
+
+def parse_csv_buf(buf) -> dict:
+    """Parse fixture csv content from an in-memory or file-like buffer.
+
+    Accepts anything the csv module can iterate (an open file, an
+    io.StringIO around a downloaded body, ...), so callers holding the
+    csv bytes in memory never need to round-trip through a file on disk.
+
+    Args:
+        buf: A text-mode file-like object yielding the csv lines.
+
+    Returns:
+        A dict with the parsed stock records.
+    """
+    return {"stock": list(parse_csv_rows(buf))}
+
+
+def parse_csv_fast(payload: bytes) -> dict:
+    """Parse fixture csv bytes with pyarrow's vectorized reader.
+
+    pyarrow's C++ tokenizer is an order of magnitude faster than the
+    row-by-row python parser on multi-MB inputs. All columns are read as
+    strings so the rows go through the same parse_product shaping as the
+    other paths. Falls back to parse_csv_buf when pyarrow is absent.
+
+    Args:
+        payload (bytes): The raw csv bytes.
+
+    Returns:
+        A dict with the parsed stock records.
+    """
+    if pyarrow is None:
+        return parse_csv_buf(io.StringIO(payload.decode('utf-8')))
+
+    table = pyarrow.csv.read_csv(
+        pyarrow.py_buffer(payload),
+        read_options=pyarrow.csv.ReadOptions(column_names=CSV_HEADERS),
+        parse_options=pyarrow.csv.ParseOptions(escape_char='\\'),
+        convert_options=pyarrow.csv.ConvertOptions(
+            column_types={name: pyarrow.string() for name in CSV_HEADERS}))
+    rows = zip(*(table.column(name).to_pylist() for name in CSV_HEADERS))
+    return {"stock": [parse_product(row) for row in rows]}
+
+
 def parse_csv(path: str) -> Optional[dict]:
     """Parse the fixture csv file and convert to a dictionary
 
+    Uses pandas' vectorized csv reader when pandas is installed, falling
+    back to the pure-python csv module otherwise.
+
     Writes to stderr if file is not present.
 
     Args:
@@ -62,13 +165,11 @@ def parse_csv(path: str) -> Optional[dict]:
     Returns:
         A dict representing the csv if file exists, None otherwise.
     """
-    document = {}
-    document["stock"] = []
     try:
+        if pandas is not None:
+            return {"stock": _parse_stock_pandas(path)}
         with open(path, 'rt') as f:
-            for row in csv.reader(f, escapechar='\\'):
-                document["stock"].append(parse_product(row))
-        return document
+            return parse_csv_buf(f)
     except Exception as e:
         sys.stderr.write(f"err: {e}")
 
@@ -83,7 +184,9 @@ def main():
     parsed_args = parser.parse_args()
     document = parse_csv(parsed_args.path)
     if document:
-        print(yaml.dump(document, sort_keys=False))
+        # Emit straight to stdout instead of materializing the whole
+        # document as one string first.
+        yaml.dump(document, sys.stdout, sort_keys=False, Dumper=SafeDumper)
     else:
         sys.exit(-1)
 